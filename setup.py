@@ -1,4 +1,4 @@
-from distutils.core import setup
+from setuptools import setup
 
 
 def readfile(name):
@@ -10,14 +10,23 @@ README = readfile('README.rst')  # info
 
 
 install_requires = [
-    'selenium >= 3.0.2'
+    'selenium >= 3.0.2',
+    'lxml >= 3.4.0',
+    'requests >= 2.0.0'
 ]
 
 
+extras_require = {
+    'async': ['playwright >= 1.8.0'],  # webparser.async_crawler
+}
+
+
 setup(
     name='webparser',
     version='1.0',
     packages=['webparser'],
+    install_requires=install_requires,
+    extras_require=extras_require,
     url='https://github.com/soomrack/webparser',
     license='MIT',
     author='Mikhail Ananyevskiy (aka soomrack)',
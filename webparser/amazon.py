@@ -3,34 +3,53 @@
 
 """
 
+import lxml.etree
+
 from webparser.crawler import Crawler
+from webparser.static_crawler import StaticCrawler
 
 __version__ = r'1.00'
 __author__ = r'Mikhail Ananyevskiy (aka soomrack)'
 
 
-class AmazonBook(Crawler):
-    """Parses amazon book webpage.
+class AmazonBookParsers(object):
+    """Parsers of amazon book webpage (mixin for crawler classes).
 
     Parses:
         + title
         + cover_url
     """
 
+    __slots__ = ()
+
+    TITLE_ID = 'productTitle'
+    COVER_ID = 'imgBlkFront'
+    TITLE_XPATH = "//span[@id='productTitle'][1]/text()"
+    COVER_XPATH = "//img[@id='imgBlkFront'][1]/@src"
+    # Compiled once, used when lxml tree of webpage is loaded. Plain strings
+    # are returned (no smart strings), so data doesn't keep the tree alive.
+    _TITLE_XP = lxml.etree.XPath(TITLE_XPATH, smart_strings=False)
+    _COVER_XP = lxml.etree.XPath(COVER_XPATH, smart_strings=False)
+
     def __init__(self, url=None):
-        self.parsers = {
+        self.parsers = self.register_parsers(
             self.parse_title,
             self.parse_cover_url
-        }
+        )
         super().__init__(url)
 
     def parse_title(self):
         """Parses book title.
 
         """
-        title = self.webdriver.find_element_by_xpath(
-            "//span[@id='productTitle'][1]"
-        ).get_attribute('innerHTML')
+        tree = self.webpage.get('tree')
+        if tree is not None:
+            titles = self._TITLE_XP(tree)
+            title = titles[0] if titles else None
+        else:
+            title = self.webdriver.find_element_by_id(
+                self.TITLE_ID
+            ).get_attribute('innerHTML')
         self.data['title'] = title
         if title:
             return None
@@ -40,15 +59,37 @@ class AmazonBook(Crawler):
         """Parses url of book cover image.
 
         """
-        cover_url = self.webdriver.find_element_by_xpath(
-            "//img[@id='imgBlkFront'][1]"
-        ).get_attribute('src')
+        tree = self.webpage.get('tree')
+        if tree is not None:
+            cover_urls = self._COVER_XP(tree)
+            cover_url = cover_urls[0] if cover_urls else None
+        else:
+            cover_url = self.webdriver.find_element_by_id(
+                self.COVER_ID
+            ).get_attribute('src')
         self.data['cover_url'] = cover_url
         if cover_url:
             return None
         return 'Cover url not found.'
 
 
+class AmazonBook(AmazonBookParsers, StaticCrawler):
+    """Parses amazon book webpage (static html, no browser).
+
+    """
+
+    __slots__ = ()
+
+
+class SeleniumAmazonBook(AmazonBookParsers, Crawler):
+    """Parses amazon book webpage with selenium webdriver.
+
+    Fallback for AmazonBook, if webpage needs a browser.
+    """
+
+    __slots__ = ()
+
+
 def main():
     print(__doc__)
 
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""tiny framework for parsing web with playwright (asyncio).
+
+This module provides base class for asynchronous webparser, it can
+    1. open webpages with playwright (Chromium, Chrome DevTools Protocol);
+    2. run a sequence of parsers;
+    3. handle playwright exceptions;
+    4. log success and log fail;
+    5. load and parse many webpages concurrently.
+
+Each webpage is opened in a separate browser context of one browser,
+so webpages don't share cookies and there is no browser startup per webpage.
+Selenium webparser.crawler.Crawler stays available for compatibility.
+
+
+Important
+    Playwright is an optional dependency, install it with the browser.
+    $ pip install webparser[async]
+    $ playwright install chromium
+
+
+Example
+        Create module contains parsers:
+        #-------[ amazon.py ]---------------------------------------------------
+            from webparser.async_crawler import AsyncCrawler
+
+            class AsyncAmazonBook(AsyncCrawler):
+                def __init__(self, context=None):
+                    self.parsers = (self.parse_title,)
+                    super().__init__(context)
+
+                def parse_title(self):
+                    '''Parses book title.'''
+                    titles = self.webpage['tree'].xpath(
+                        "//span[@id='productTitle'][1]/text()"
+                    )
+                    self.data['title'] = titles[0] if titles else None
+                    if self.data['title']:
+                        return None
+                    return 'Title not found.'
+        #-----------------------------------------------------------------------
+
+        Example script:
+        #-------[ parser.py ]---------------------------------------------------
+            import asyncio
+            from amazon import AsyncAmazonBook
+
+            urls = ['http://...', 'http://...', 'http://...']
+            results = asyncio.run(AsyncAmazonBook.crawl_many(urls))
+            for url, is_ok, data in results:
+                if is_ok:
+                    print(url, data['title'])
+        #-----------------------------------------------------------------------
+
+
+Guideline [parsers]
+    1. Parser can be a function over lxml tree of webpage
+        (self.webpage['tree']), it is the fastest way.
+
+    2. Parser can be a coroutine function, if it needs live interaction
+        with webpage (self.webpage['page'] is playwright page), example:
+            async def parse_title(self):
+                '''Parses book title.'''
+                title = await self.webpage['page'].inner_text('#productTitle')
+                ...
+
+    3. Parsers are run concurrently, each parser should store its data
+        with its own keys in self.data.
+
+
+See webparser.crawler module docs for guidelines on child classes and logging.
+"""
+
+import asyncio
+import inspect
+import logging
+import lxml.etree
+import playwright.async_api
+
+from webparser.crawler import Crawler
+
+__version__ = r'1.00'
+__author__ = r'Mikhail Ananyevskiy (aka soomrack) <soomrack@gmail.com>'
+
+
+class AsyncCrawler(object):
+    """Base class for asynchronous web webparser.
+
+    Any asynchronous webcrawler should be a child class of current class
+    with realized routines for data retrieval (parsers).
+    See current module docs for examples.
+
+    Class attributes:
+        parsers: empty tuple of functions (tuple of parsers).
+            This attribute should be overrided in objects.
+            and can be overrided in child class.
+
+        blocked_resources: tuple of strings.
+            Playwright resource types which are not loaded,
+            this speeds up webpage loading.
+            Default value is ('image', 'stylesheet', 'font', 'media').
+
+    Object attributes:
+        context: playwright browser context.
+            It is used to open webpages.
+
+        data: dictionary.
+            All data retrieved from webpage should be stored here.
+
+        webpage: dictionary.
+            All technical data about current webpage should be stored here,
+            self.webpage['url'] is the url of current webpage,
+            self.webpage['page'] is playwright page of current webpage,
+            self.webpage['tree'] is lxml tree of current webpage
+            (exists only while parse() runs).
+    """
+
+    parsers = ()
+    register_parsers = staticmethod(Crawler.register_parsers)
+    _load_tree = Crawler._load_tree  # Parses page source (XHTML too)
+    blocked_resources = ('image', 'stylesheet', 'font', 'media')
+
+    def __init__(self, context=None):
+        """Inits object with playwright browser context.
+
+        Args:
+            context: playwright browser context.
+                Optional, it can be set later as self.context.
+                Default value is None.
+        """
+        self.context = context
+        self.data = {}
+        self.webpage = {}
+
+    async def get(self, url):
+        """Try to open webpage in a new page of browser context.
+
+        Erases self.data and self.webpage, then sets self.webpage['url']
+        to url and self.webpage['page'] to playwright page.
+        Waits only for html document (DOMContentLoaded).
+
+        Args:
+            url: string.
+
+        Returns:
+            True if download success, False otherwise.
+        """
+        self.data = {}
+        self.webpage = {'url': url}
+        try:
+            page = await self.context.new_page()
+            self.webpage['page'] = page
+            await page.goto(url, wait_until='domcontentloaded')
+            logging.info('[OK] get webpage %s', url)
+            return True
+        except (playwright.async_api.Error,
+                AttributeError) as error:
+            logging.warning('[FAIL] get webpage %s', url)
+            logging.info(error)
+            return False
+
+    async def parse(self, parsers=None):
+        """Run parser routines for object concurrently.
+
+        Each parser function (or coroutine function) should return None
+        if success and error message if shit happens. The first line
+        of parser docstring is logging with the status of the result.
+        Webpage source is parsed into self.webpage['tree'] once,
+        the tree is dropped when parsers are completed.
+
+        Args:
+            parsers: tuple of functions (parsers).
+                If parsers argument is None, then self.parsers tuple is used.
+
+        Returns:
+            Integer -- number of failed parsers.
+            Returns 0 if all parsers were completed without errors.
+        """
+        if not parsers:
+            parsers = self.parsers
+        parsers = self.register_parsers(*parsers)
+        try:
+            self.webpage['page_source'] = await self.webpage['page'].content()
+        except (playwright.async_api.Error,
+                KeyError) as error:
+            logging.warning('[FAIL] parse webpage source %s',
+                            self.webpage.get('url'))
+            logging.info(error)
+        self._load_tree()
+        try:
+            results = await asyncio.gather(
+                *(self._run_parser(parser) for parser in parsers)
+            )
+        finally:
+            self.webpage.pop('tree', None)
+        return Crawler._log_results(zip(parsers, results))
+
+    @staticmethod
+    async def _run_parser(parser):
+        """Runs parser, returns tuple (error message, exception).
+
+        Exception is None if parser was completed without exceptions,
+        it is the contract of Crawler._run_parser().
+        """
+        try:
+            error_message = parser()
+            if inspect.isawaitable(error_message):
+                error_message = await error_message
+            return error_message, None
+        except (playwright.async_api.Error,
+                lxml.etree.LxmlError,
+                AttributeError,
+                KeyError) as error:
+            return None, error
+
+    async def close(self):
+        """Close webpage (playwright page).
+
+        Returns:
+            True is success, False otherwise.
+        """
+        try:
+            await self.webpage.pop('page').close()
+            logging.info('[OK] close webpage.')
+            return True
+        except (playwright.async_api.Error,
+                KeyError) as error:
+            logging.warning('[FAIL] close webpage.')
+            logging.info(error)
+            return False
+
+    async def get_parse_close(self, url, parsers=None):
+        """Composite function, runs get(), parse() and close().
+
+        Args:
+            url: string.
+                See description of get() method.
+
+            parsers: tuple of functions (parsers).
+                See description of parse() method.
+
+        Returns:
+            True if webpage was loaded, all parsers were completed
+            without errors and webpage was closed, False otherwise.
+        """
+        if await self.get(url):
+            errors_count = await self.parse(parsers)
+            is_close = await self.close()
+            return errors_count == 0 and is_close
+        if 'page' in self.webpage:  # Page was opened, but not loaded
+            await self.close()
+        return False
+
+    @classmethod
+    async def crawl_many(cls, urls, max_concurrency=5):
+        """Loads and parses several webpages concurrently.
+
+        Launches one headless Chromium, each webpage is opened
+        in a new browser context (no shared cookies). The number
+        of simultaneously loaded webpages is bounded by max_concurrency.
+
+        Args:
+            urls: iterable of strings.
+
+            max_concurrency: integer.
+                Maximum number of simultaneously loaded webpages.
+                Default value is 5.
+
+        Returns:
+            List of tuples (url, is_ok, data) in the order of urls,
+            see description of Crawler.crawl_many().
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async with playwright.async_api.async_playwright() as driver:
+            browser = await driver.chromium.launch(headless=True)
+            try:
+                async def crawl(url):
+                    async with semaphore:
+                        context = await browser.new_context()
+                        try:
+                            await context.route('**/*', cls._route)
+                            crawler = cls(context)
+                            is_ok = await crawler.get_parse_close(url)
+                            return url, is_ok, crawler.data
+                        finally:
+                            await context.close()
+
+                return await asyncio.gather(*(crawl(url) for url in urls))
+            finally:
+                await browser.close()
+
+    @classmethod
+    async def _route(cls, route):
+        """Aborts requests of blocked resources, continues other requests."""
+        if route.request.resource_type in cls.blocked_resources:
+            await route.abort()
+        else:
+            await route.continue_()
+
+
+def main():
+    """Print documentation and exit."""
+    print(__doc__)
+
+
+if __name__ == r'__main__':
+    main()
@@ -3,7 +3,7 @@
 
 This module provides base class for webparser, it can
     1. open webpages with selenium webdriver;
-    2. run a set of parsers;
+    2. run a sequence of parsers;
     3. handle selenium exceptions;
     4. log success and log fail.
 
@@ -20,7 +20,7 @@ Example
 
             class AmazonBook(Crawler):
                 def __init__(self, url=None):
-                    self.parsers = {self.parse_title, self.parse_cover_url}
+                    self.parsers = (self.parse_title, self.parse_cover_url)
                     super().__init__(url)
 
                 def parse_title(self):
@@ -55,10 +55,21 @@ Example
         #-------[ parser.py ]---------------------------------------------------
             from webparser.amazon import AmazonBook
 
-            amazon_book = AmazonBook()        # Create object
-            amazon_book.get('http://...')     # Load webpage
-            amazon book.parse_title()         # Parse book title
-            print(amazon_book.data['title'])  # Print parsed book title
+            amazon_book = AmazonBook()                     # Create object
+            amazon_book.get('http://...')                  # Load webpage
+            amazon_book.parse((amazon_book.parse_title,))  # Parse book title
+            print(amazon_book.data['title'])               # Print book title
+        #-----------------------------------------------------------------------
+
+        Example script 03:
+        #-------[ parser.py ]---------------------------------------------------
+            from webparser.amazon import AmazonBook
+
+            urls = ['http://...', 'http://...', 'http://...']
+            results = AmazonBook.crawl_many(urls, workers=2)  # Parallel parse
+            for url, is_ok, data in results:
+                if is_ok:
+                    print(url, data['title'])  # Print parsed book titles
         #-----------------------------------------------------------------------
 
 
@@ -76,6 +87,10 @@ Guideline [webdriver]
     3. Change webdriver for selected object
         myobject.webdriver = Crawler.init_webdriver_chrome_remote(ip, port)
 
+    4. Use pool of webdrivers for new objects of selected class
+        (each object gets its own webdriver, see webparser.pool module)
+        AmazonBook.webdriver_pool = webparser.pool.WebDriverPool(size=2)
+
 
 Guideline [child classes]
     1. Realization of parsers should be placed in child classes.
@@ -83,8 +98,8 @@ Guideline [child classes]
 
     1.1 Child class should have constructor
         def __init__(self, url=None):
-            self.parsers = {self.parse_title}  # Set of routine parsers
-            super().__init__(url)              # Parent class constructor
+            self.parsers = (self.parse_title,)  # Routine parsers
+            super().__init__(url)               # Parent class constructor
 
     1.2 Child class should have parsers
         def parse_title(self):          # Recommend to begin name with 'parser_'
@@ -101,6 +116,13 @@ Guideline [child classes]
         and separate module (with several classes) for each website.
         Example: module "amazon.py" with classes "AmazonBook", "AmazonCoupons".
 
+    3. If data of webpage is rendered by server (static html), then
+        use webparser.static_crawler.StaticCrawler as parent class,
+        it downloads webpages without browser and it is much faster.
+
+    4. For asyncio applications use webparser.async_crawler.AsyncCrawler
+        as parent class, it loads webpages with playwright.
+
 
 Guideline [logging]
     1. Level WARNINGS:
@@ -149,7 +171,15 @@ IN THE SOFTWARE.
 #    1.3 Add Chrome
 
 
+import atexit
 import logging
+import functools
+import threading
+import collections
+import concurrent.futures
+import multiprocessing.util
+import lxml.etree
+import lxml.html
 import selenium.webdriver
 import selenium.common.exceptions
 
@@ -159,6 +189,84 @@ __author__ = r'Mikhail Ananyevskiy (aka soomrack) <soomrack@gmail.com>'
 __date__ = r'05 October 2017'
 
 
+_WEBDRIVER_ERRORS = (selenium.common.exceptions.WebDriverException,
+                     AttributeError)
+
+_worker_crawler = None  # Process-local crawler used by Crawler.crawl_many()
+
+
+def _log_and_swallow(message, failure=False, message_args=None,
+                     errors=_WEBDRIVER_ERRORS):
+    """Decorator, logs the result of function and handles its exceptions.
+
+    If function is completed, then '[OK] message' is logged (level INFO)
+    and the result of function is returned. If function raises one of
+    errors, then '[FAIL] message' is logged (level WARNING), the exception
+    is logged (level INFO) and failure is returned.
+
+    Args:
+        message: string.
+            Logging message, it can contain %s placeholders.
+
+        failure: any value.
+            It is returned if function failed.
+            Default value is False.
+
+        message_args: function.
+            Takes arguments of decorated function and returns tuple
+            of arguments for logging message.
+            Default value is None (no arguments).
+
+        errors: tuple of exceptions.
+            Default value is (WebDriverException, AttributeError).
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            log_args = message_args(*args, **kwargs) if message_args else ()
+            try:
+                result = function(*args, **kwargs)
+            except errors as error:
+                logging.warning('[FAIL] ' + message, *log_args)
+                logging.info(error)
+                return failure
+            logging.info('[OK] ' + message, *log_args)
+            return result
+        return wrapper
+    return decorator
+
+
+def _url_message_args(crawler, url, *args, **kwargs):
+    """Returns url as logging message argument (see _log_and_swallow)."""
+    return (url,)
+
+
+def _worker_init(cls):
+    """Inits process-local crawler with its own webdriver (pool initializer).
+
+    The webdriver inherited from the parent process is dropped (see
+    Crawler._drop_process_resources), so each worker process owns
+    a separate selenium session, it is quitted when the worker process exits.
+    """
+    global _worker_crawler
+    Crawler._webdriver_lock = threading.Lock()
+    Crawler._result_cache_lock = threading.Lock()
+    Crawler._webdrivers = []
+    multiprocessing.util.Finalize(None, Crawler.quit_all, exitpriority=10)
+    cls._drop_process_resources()
+    cls.init_webdriver()
+    _worker_crawler = cls()
+
+
+def _worker_crawl(url):
+    """Loads and parses webpage with process-local crawler (pool job).
+
+    Returns tuple (url, result of get_parse_close(), data).
+    """
+    is_ok = _worker_crawler.get_parse_close(url)
+    return url, is_ok, _worker_crawler.data
+
+
 class Crawler(object):
     """Base class for web webparser.
 
@@ -172,47 +280,103 @@ class Crawler(object):
             to interact with webpages (download, parse, etc.).
             This attribute can be overrided in a child class or in objects.
 
-        parsers: empty set of functions (set of parsers).
-            This attribute should be overrided in objects.
-            and can be overrided in child class.
+        parse_page_source: boolean.
+            If True, then webpage source is fetched from webdriver once
+            after loading and parse() parses it into lxml tree, so parsers
+            can query self.webpage['tree'] without webdriver roundtrips.
+            Set it to False in a child class for webpages which parsers
+            need live interaction with webdriver (javascript, etc.).
+            Default value is True.
+
+        parallel_parsers: boolean.
+            If True, then parsers are run concurrently in threads while
+            lxml tree of webpage is loaded. Set it to True in a child class
+            only if its parsers don't touch webdriver (selenium webdriver
+            is not thread-safe) and do blocking work besides lxml queries
+            (lxml XPath holds the GIL, so pure XPath parsers gain nothing).
+            Default value is False.
+
+        webdriver_pool: webparser.pool.WebDriverPool object.
+            If it is not None, then each new object acquires its own
+            webdriver from the pool (self.webdriver) and close() releases
+            it back to the pool.
+            Default value is None.
+
+        result_cache_size: integer.
+            Maximum number of webpages which parsed data is kept
+            by get_parse_close() (least recently used are dropped).
+            Each class has its own cache of this size.
+            Set it to 0 to disable the cache.
+            Default value is 1024.
 
     Object attributes:
+        parsers: tuple of functions (tuple of parsers).
+            This attribute should be set in objects before the parent
+            class constructor is called, else it is an empty tuple.
+            It can be overrided in child class as a class attribute.
+            Parsers are run in the order of the tuple, so place cheap ones
+            first. Parser function can have optional attribute cost (number),
+            then parsers are run in the order of increasing cost.
+
         data: dictionary.
             All data retrieved from webpage should be stored here.
 
         webpage: dictionary.
             All technical data about current webpage should be stored here,
-            self.webpage['url'] is the url of current webpage.
+            self.webpage['url'] is the url of current webpage,
+            self.webpage['page_source'] is the source of current webpage
+            (exists after get() if parse_page_source is True),
+            self.webpage['tree'] is lxml tree of current webpage
+            (exists only while parse() runs, then it is dropped
+            to free memory).
 
     Optional object attributes (by default -- no exists):
         webdriver: selenium webdriver object.
             If exists, then object will interact with webpage
             through self.webdriver, ignoring cls.webdriver.
-
-        parsers: set of functions (set of parsers).
-            This attribute should be overrided in objects.
     """
 
+    # parsers, data and webpage are set in every object, so they are slots;
+    # __dict__ is kept for optional object attribute webdriver and
+    # attributes of child classes, it is created only when one is set.
+    # Child classes should declare __slots__ = () or their own slots.
+    __slots__ = ('parsers', 'data', 'webpage', '__dict__')
+
     webdriver = None
-    parsers = {}
+    webdriver_pool = None
+    parse_page_source = True
+    parallel_parsers = False
+    result_cache_size = 1024
+    _result_caches = {}  # Class -> OrderedDict (url -> data)
+    _result_cache_lock = threading.Lock()
+    _webdriver_lock = threading.Lock()
+    _webdrivers = []  # All webdrivers inited by init_webdriver()
+    _capabilities_cache = {}  # Chrome options -> capabilities
 
     def __init__(self, url=None, parsers=None):
-        """Inits object with webpage url and with the specified set of parsers.
+        """Inits object with webpage url and with the specified parsers.
 
         Args:
             url: string.
                 Optional, if it is not None, then the initialization includes
-                loading webpage, parsing it and closing it.
+                loading webpage, parsing it and resetting browser page.
                 Default value is None.
 
-            parsers: set of functions.
-                Optional, if it is not None, then object will use this set
+            parsers: tuple of functions.
+                Optional, if it is not None, then object will use this tuple
                 of functions as webpage parsers.
                 Default value is None.
         """
+        if getattr(self, 'parsers', None) is None:
+            self.parsers = ()
         self.data = {}
         self.webpage = {}
-        self.init_webdriver()
+        if self.webdriver_pool is not None:
+            self.webdriver = self.webdriver_pool.acquire(
+                factory=type(self).webdriver_default
+            )
+        else:
+            self.init_webdriver()
         if url:
             self.get_parse_close(url, parsers)
 
@@ -221,16 +385,54 @@ class Crawler(object):
         """Inits webdriver (class attribute).
 
         Default webdriver depends on selected class, so this is a class method.
+        It is thread-safe: objects created in parallel threads share
+        one webdriver, no extra browsers are started.
         """
-        if not cls.webdriver:
-            cls.webdriver = cls.webdriver_default()
+        if cls.webdriver is None:
+            with cls._webdriver_lock:
+                if cls.webdriver is None:
+                    cls.webdriver = cls.webdriver_default()
+                    if cls.webdriver is not None:
+                        cls._webdrivers.append(cls.webdriver)
 
+    @classmethod
+    def _drop_process_resources(cls):
+        """Drops resources inherited from the parent process (in worker).
+
+        Inherited resources are not closed, they are used by the parent.
+        Child class which inits other resources in init_webdriver()
+        should override this method.
+        """
+        cls.webdriver_pool = None
+        cls.webdriver = None
+
+    @staticmethod
+    def quit_all():
+        """Quits all webdrivers inited by init_webdriver().
+
+        It is called on interpreter exit, so no browsers are left running.
+        """
+        with Crawler._webdriver_lock:
+            webdrivers, Crawler._webdrivers = Crawler._webdrivers, []
+        for webdriver in webdrivers:
+            Crawler._quit_webdriver(webdriver)
+
+    @staticmethod
+    @_log_and_swallow('quit webdriver.')
+    def _quit_webdriver(webdriver):
+        """Quits webdriver, returns True is success, False otherwise."""
+        webdriver.quit()
+        return True
+
+    @_log_and_swallow('get webpage %s', message_args=_url_message_args)
     def get(self, url):
         """Try to open webpage in browser (i.e. selenium webdriver).
 
         New webpage means that self.data and self.webpage should be new,
         this way current routine erases self.data and self.webpage,
         then sets self.webpage['url'] to url.
+        If parse_page_source is True, then webpage source is stored
+        in self.webpage['page_source'].
 
         Args:
             url: string.
@@ -240,97 +442,292 @@ class Crawler(object):
         """
         self.data = {}
         self.webpage = {'url': url}
-        try:
-            self.webdriver.get(url)
-            logging.info('[OK] get webpage {}'.format(url))
-            return True
-        except (selenium.common.exceptions.WebDriverException,
-                AttributeError) as error:
-            logging.warning('[FAIL] get webpage {}'.format(url))
-            logging.info(error)
-            return False
+        self.webdriver.get(url)
+        if self.parse_page_source:
+            self.webpage['page_source'] = self.webdriver.page_source
+        return True
 
-    def parse(self, parsers=None):
+    def parse(self, parsers=None, serial=None):
         """Run parser routines for object.
 
         This method is a routine for running parsers and handling exceptions.
         Each parser function should return None if success and error message
         if shit happens. The first line of parser docstring is logging with
         the status of the result (OK or FAIL).
+        Parsers are run one by one, or concurrently in threads if
+        parallel_parsers is True and lxml tree (self.webpage['tree'])
+        is loaded. Each parser should store its data with its own keys
+        in self.data.
+        Webpage source is parsed into the tree once and the tree is dropped
+        when parsers are completed, so run all parsers with one call.
 
         Args:
-            parsers: set of functions (parsers).
-                If parsers argument is None, then self.parsers set is used.
+            parsers: tuple of functions (parsers).
+                If parsers argument is None, then self.parsers tuple is used.
+                Parsers are run in the order of increasing cost attribute
+                (parsers without cost have cost 0), then in the tuple order.
+
+            serial: boolean.
+                If True, then parsers are run one by one, if False, then
+                parsers are run concurrently in threads.
+                If None, then parsers are run concurrently only if
+                parallel_parsers is True and lxml tree of webpage is loaded.
+                Default value is None.
 
         Returns:
             Integer -- number of failed parsers.
             Returns 0 if all parsers were completed without errors.
         """
-        errors_count = 0
         if not parsers:
             parsers = self.parsers
+        parsers = sorted(self.register_parsers(*parsers),
+                         key=lambda parser: getattr(parser, 'cost', 0))
+        self._load_tree()
+        try:
+            if serial is None:
+                serial = not (self.parallel_parsers
+                              and 'tree' in self.webpage)
+            if serial or len(parsers) < 2:
+                results = ((parser, self._run_parser(parser))
+                           for parser in parsers)
+            else:
+                with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=len(parsers)) as executor:
+                    futures = {executor.submit(self._run_parser, parser):
+                               parser for parser in parsers}
+                    completed = concurrent.futures.as_completed(futures)
+                    results = [(futures[future], future.result())
+                               for future in completed]
+            return self._log_results(results)
+        finally:
+            self.webpage.pop('tree', None)
+
+    def _load_tree(self):
+        """Parses self.webpage['page_source'] into self.webpage['tree'].
+
+        Webpage source is dropped, only the tree is kept.
+        Source of webdriver is a string, it is encoded to utf-8 bytes
+        and parsed as utf-8, because lxml doesn't accept strings with
+        encoding declaration (XHTML pages).
+        """
+        page_source = self.webpage.pop('page_source', None)
+        if page_source is None:
+            return
+        parser = None
+        if isinstance(page_source, str):
+            page_source = page_source.encode('utf-8')
+            parser = lxml.html.HTMLParser(encoding='utf-8')
+        try:
+            self.webpage['tree'] = lxml.html.fromstring(page_source,
+                                                        parser=parser)
+        except (lxml.etree.LxmlError, ValueError) as error:
+            logging.warning('[FAIL] parse webpage source %s',
+                            self.webpage.get('url'))
+            logging.info(error)
+
+    @staticmethod
+    def register_parsers(*parsers):
+        """Prepares parsers for parse() and returns them as a tuple.
+
+        The first line of parser docstring (it is used in logs) is computed
+        once and is stored in attribute _info of parser function.
+        parse() registers its parsers itself, call this method
+        in constructor to prepare parsers in advance, example:
+            self.parsers = self.register_parsers(self.parse_title)
+
+        Args:
+            parsers: functions (parsers).
+
+        Returns:
+            Tuple of functions (parsers).
+        """
         for parser in parsers:
-            parser_info = parser.__doc__.splitlines()[0]
-            try:
-                error_message = parser()
-                if error_message:
-                    logging.warning('[FAIL] {}'.format(parser_info))
-                    logging.info(error_message)
-                    errors_count += 1
-                else:
-                    logging.info('[OK] {}'.format(parser_info))
-            except (selenium.common.exceptions.WebDriverException,
-                    AttributeError) as error:
-                logging.warning('[FAIL] {}'.format(parser_info))
+            function = getattr(parser, '__func__', parser)
+            if not hasattr(function, '_info'):
+                function._info = function.__doc__.splitlines()[0]
+        return parsers
+
+    @staticmethod
+    def _log_results(results):
+        """Logs results of parsers, returns number of failed parsers.
+
+        Args:
+            results: iterable of tuples (parser, (error message, exception)),
+                parsers should be registered (see register_parsers()).
+        """
+        errors_count = 0
+        for parser, (error_message, error) in results:
+            if error:
+                logging.warning('[FAIL] %s', parser._info)
                 logging.info(error)
                 errors_count += 1
+            elif error_message:
+                logging.warning('[FAIL] %s', parser._info)
+                logging.info(error_message)
+                errors_count += 1
+            else:
+                logging.info('[OK] %s', parser._info)
         return errors_count
 
+    @staticmethod
+    def _run_parser(parser):
+        """Runs parser, returns tuple (error message, exception).
+
+        Exception is None if parser was completed without exceptions.
+        """
+        try:
+            return parser(), None
+        except _WEBDRIVER_ERRORS as error:
+            return None, error
+
+    @_log_and_swallow('reset webpage.')
+    def reset_page(self):
+        """Reset browser page for the next webpage.
+
+        Deletes all cookies and opens blank page, so the same browser
+        (i.e. selenium webdriver) can be reused for the next webpage
+        without paying for the browser startup.
+
+        Returns:
+            True is success, False otherwise.
+        """
+        self.webdriver.delete_all_cookies()
+        self.webdriver.get('about:blank')
+        return True
+
+    @_log_and_swallow('close webpage.')
     def close(self):
         """Close webpage.
 
         This function may be useful if you don't want to keep connection
         to website. If you don't need webpage it is a good practice
         to close it in browser (i.e. in selenium webdriver).
+        Call it once at the end of a batch, get_parse_close() doesn't
+        close the browser page and only resets it.
+        If webdriver_pool is used, then webdriver is released to the pool.
 
         Returns:
             True is success, False otherwise.
         """
-        try:
-            self.webdriver.close()
-            logging.info('[OK] close webpage.')
+        if self.webdriver_pool is not None and 'webdriver' in self.__dict__:
+            self.webdriver_pool.release(self.__dict__.pop('webdriver'))
             return True
-        except (selenium.common.exceptions.WebDriverException,
-                AttributeError) as error:
-            logging.warning('[FAIL] close webpage.')
-            logging.info(error)
-            return False
+        self.webdriver.close()
+        return True
 
     def get_parse_close(self, url, parsers=None):
-        """Composite function, runs self.get(), self.parse(), self.close().
+        """Composite function, runs get(), parse() and reset_page().
 
         This method implements abstract algorithm
             Step 1. open webpage in browser;
             Step 2. retrieve data from webpage (parse it);
-            Step 3. close webpage in browser.
+            Step 3. reset webpage in browser (browser stays open).
+
+        Data of the webpage parsed without errors is cached by url
+        (in the cache of the class of object), so the next call for the same url copies the cached
+        data to self.data and skips all steps. The cache is used only
+        with default parsers (parsers argument is None).
+        Use refresh() to parse the webpage again.
 
         Args:
             url: string.
                 See description of get() method.
 
-            parsers: set of functions (parsers).
+            parsers: tuple of functions (parsers).
                 See description of parse() method.
 
         Returns:
-            True if success, False otherwise.
+            True if webpage was loaded, all parsers were completed
+            without errors and webpage was reset, False otherwise.
         """
+        data = self._cached_result(url) if parsers is None else None
+        if data is not None:
+            self.data = data
+            self.webpage = {'url': url}
+            logging.info('[OK] get cached data %s', url)
+            return True
         if self.get(url):
-            is_parse_error = self.parse(parsers)
-            is_close_error = self.close()
-            return bool(is_parse_error and is_close_error)
+            errors_count = self.parse(parsers)
+            is_reset = self.reset_page()
+            if parsers is None and not errors_count:
+                self._cache_result(url, self.data)
+            return errors_count == 0 and is_reset
         else:
             return False
 
+    def refresh(self, url, parsers=None):
+        """Drops cached data of webpage, then runs get_parse_close().
+
+        Args:
+            url: string.
+
+            parsers: tuple of functions (parsers).
+                See description of parse() method.
+
+        Returns:
+            See description of get_parse_close() method.
+        """
+        with self._result_cache_lock:
+            self._result_cache().pop(url, None)
+        return self.get_parse_close(url, parsers)
+
+    @classmethod
+    def _result_cache(cls):
+        """Returns cache of current class, call it with the lock held."""
+        return cls._result_caches.setdefault(cls, collections.OrderedDict())
+
+    @classmethod
+    def _cache_result(cls, url, data):
+        """Stores copy of data in the cache, drops least recently used."""
+        if cls.result_cache_size <= 0:
+            return
+        with cls._result_cache_lock:
+            cache = cls._result_cache()
+            cache[url] = dict(data)
+            cache.move_to_end(url)
+            while len(cache) > cls.result_cache_size:
+                cache.popitem(last=False)
+
+    @classmethod
+    def _cached_result(cls, url):
+        """Returns copy of cached data or None, marks it recently used."""
+        with cls._result_cache_lock:
+            cache = cls._result_cache()
+            data = cache.get(url)
+            if data is None:
+                return None
+            cache.move_to_end(url)
+            return dict(data)
+
+    @classmethod
+    def crawl_many(cls, urls, workers=4):
+        """Loads and parses several webpages in parallel.
+
+        Urls are dispatched to a pool of worker processes, each worker
+        owns its own webdriver (selenium session) and reuses it for all
+        its urls. Processes are used instead of threads because selenium
+        webdriver is not thread-safe. The pool size also bounds the number
+        of simultaneous requests to the website.
+
+        Args:
+            urls: iterable of strings.
+
+            workers: integer.
+                Number of worker processes (and of webdrivers).
+                Default value is 4.
+
+        Returns:
+            List of tuples (url, is_ok, data) in the order of urls,
+            is_ok is the result of get_parse_close() (True if webpage
+            was loaded and parsed without errors), data is self.data
+            (it can be partial if is_ok is False).
+        """
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_worker_init,
+                initargs=(cls,)) as executor:
+            return list(executor.map(_worker_crawl, urls))
+
     @staticmethod
     def webdriver_default():
         """Initializes the default webdriver.
@@ -348,9 +745,20 @@ class Crawler(object):
         return Crawler.webdriver_chrome_remote_headless('127.0.0.1', '4444')
 
     @staticmethod
-    def webdriver_chrome_remote(ip_addr, port):
+    @_log_and_swallow(
+        'init %s.', failure=None,
+        message_args=lambda *args, headless=False, **options: (
+            'Chrome remote headless' if headless else 'Chrome remote',
+        )
+    )
+    def webdriver_chrome_remote(ip_addr, port, *, headless=False,
+                                disable_js=False, block_resources=False,
+                                page_load_strategy='normal'):
         """Initializes Chrome remote selenium webdriver.
 
+        Capabilities are generated once for each combination of options
+        and then are taken from the cache.
+
         Args:
             ip_addr: string.
                 Remote ip, example '127.0.0.1'.
@@ -358,110 +766,102 @@ class Crawler(object):
             port: string.
                 Remote port, example '4444'.
 
+            headless: boolean.
+                If True, then Chrome is run in headless mode.
+                Default value is False.
+
+            disable_js: boolean.
+                If True, then javascript is disabled.
+                Default value is False.
+
+            block_resources: boolean.
+                If True, then images, stylesheets and fonts are not loaded,
+                this speeds up webpage loading and keeps browser memory
+                bounded when the webdriver is reused.
+                Default value is False.
+
+            page_load_strategy: string.
+                'normal' -- webdriver.get() waits for all resources of webpage,
+                'eager' -- webdriver.get() returns as soon as html document
+                is loaded and parsed (DOMContentLoaded), without waiting
+                for images, analytics, etc.
+                Default value is 'normal'.
+
         Returns:
             Selenium webdriver object.
         """
-        try:
+        capabilities = Crawler._chrome_capabilities(
+            headless, disable_js, block_resources, page_load_strategy
+        )
+        return selenium.webdriver.Remote(
+            command_executor='http://{}:{}/wd/hub'.format(ip_addr, port),
+            desired_capabilities=dict(capabilities),
+            keep_alive=True
+        )
+
+    @staticmethod
+    def _chrome_capabilities(headless, disable_js, block_resources,
+                             page_load_strategy):
+        """Returns cached capabilities of Chrome with selected options."""
+        key = (headless, disable_js, block_resources, page_load_strategy)
+        if key not in Crawler._capabilities_cache:
             chrome_options = selenium.webdriver.ChromeOptions()
-            webdriver = selenium.webdriver.Remote(
-                command_executor='http://{}:{}/wd/hub'.format(ip_addr, port),
-                desired_capabilities=chrome_options.to_capabilities()
-            )
-            logging.info('[OK] init Chrome remote.')
-            return webdriver
-        except (selenium.common.exceptions.WebDriverException,
-                AttributeError) as error:
-            logging.warning('[FAIL] init Chrome remote.')
-            logging.info(error)
-            return None
+            chrome_options.add_argument('--disable-dev-shm-usage')
+            if headless:
+                chrome_options.add_argument('--headless')
+                chrome_options.add_argument('--disable-gpu')
+                chrome_options.add_argument('--no-sandbox')
+            if disable_js:
+                chrome_options.add_argument('--disable-javascript')
+            if block_resources:
+                chrome_options.add_argument(
+                    '--blink-settings=imagesEnabled=false'
+                )
+                chrome_options.add_experimental_option('prefs', {
+                    'profile.managed_default_content_settings.images': 2,
+                    'profile.managed_default_content_settings.stylesheets': 2,
+                    'profile.managed_default_content_settings.fonts': 2
+                })
+            capabilities = chrome_options.to_capabilities()
+            capabilities['pageLoadStrategy'] = page_load_strategy
+            Crawler._capabilities_cache[key] = capabilities
+        return Crawler._capabilities_cache[key]
 
     @staticmethod
     def webdriver_chrome_remote_nojs(ip_addr, port):
         """Initializes Chrome remote selenium webdriver with no javascript.
 
-        Args:
-            ip_addr: string.
-                Remote ip, example '127.0.0.1'.
-
-            port: string.
-                Remote port, example '4444'.
-
-        Returns:
-            Selenium webdriver object.
+        See description of webdriver_chrome_remote() method.
         """
-        try:
-            chrome_options = selenium.webdriver.ChromeOptions()
-            chrome_options.add_argument('--disable-javascript')
-            webdriver = selenium.webdriver.Remote(
-                command_executor='http://{}:{}/wd/hub'.format(ip_addr, port),
-                desired_capabilities=chrome_options.to_capabilities()
-            )
-            logging.info('[OK] init Chrome remote.')
-            return webdriver
-        except (selenium.common.exceptions.WebDriverException,
-                AttributeError) as error:
-            logging.warning('[FAIL] init Chrome remote.')
-            logging.info(error)
-            return None
+        return Crawler.webdriver_chrome_remote(ip_addr, port, disable_js=True)
 
     @staticmethod
     def webdriver_chrome_remote_headless(ip_addr, port):
         """Initializes Chrome remote headless selenium webdriver.
 
-        Args:
-            ip_addr: string.
-                Remote ip, example '127.0.0.1'.
-
-            port: string.
-                Remote port, example '4444'.
-
-        Returns:
-            Selenium webdriver object.
+        Images, stylesheets and fonts are not loaded,
+        page load strategy is 'eager'.
+        See description of webdriver_chrome_remote() method.
         """
-        try:
-            chrome_options = selenium.webdriver.ChromeOptions()
-            chrome_options.add_argument('--headless')
-            webdriver = selenium.webdriver.Remote(
-                command_executor='http://{}:{}/wd/hub'.format(ip_addr, port),
-                desired_capabilities=chrome_options.to_capabilities()
-            )
-            logging.info('[OK] init Chrome remote headless.')
-            return webdriver
-        except (selenium.common.exceptions.WebDriverException,
-                AttributeError) as error:
-            logging.warning('[FAIL] init Chrome remote headless.')
-            logging.info(error)
-            return None
+        return Crawler.webdriver_chrome_remote(ip_addr, port, headless=True,
+                                               block_resources=True,
+                                               page_load_strategy='eager')
 
     @staticmethod
     def webdriver_chrome_remote_headless_nojs(ip_addr, port):
         """Initializes Chrome remote headless selenium webdriver with no js.
 
-        Args:
-            ip_addr: string.
-                Remote ip, example '127.0.0.1'.
+        Images, stylesheets and fonts are not loaded,
+        page load strategy is 'eager'.
+        See description of webdriver_chrome_remote() method.
+        """
+        return Crawler.webdriver_chrome_remote(ip_addr, port, headless=True,
+                                               disable_js=True,
+                                               block_resources=True,
+                                               page_load_strategy='eager')
 
-            port: string.
-                Remote port, example '4444'.
 
-        Returns:
-            Selenium webdriver object.
-        """
-        try:
-            chrome_options = selenium.webdriver.ChromeOptions()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--disable-javascript')
-            webdriver = selenium.webdriver.Remote(
-                command_executor='http://{}:{}/wd/hub'.format(ip_addr, port),
-                desired_capabilities=chrome_options.to_capabilities()
-            )
-            logging.info('[OK] init Chrome remote headless.')
-            return webdriver
-        except (selenium.common.exceptions.WebDriverException,
-                AttributeError) as error:
-            logging.warning('[FAIL] init Chrome remote headless.')
-            logging.info(error)
-            return None
+atexit.register(Crawler.quit_all)
 
 
 def main():
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""pool of warm selenium webdrivers.
+
+This module provides pool of webdrivers, it can
+    1. start webdrivers in advance (in background thread);
+    2. give webdriver to crawler and take it back (checkout/checkin);
+    3. reset webdriver for the next crawler;
+    4. recycle webdrivers which are older than ttl.
+
+Objects of crawler created in parallel threads get a warm webdriver
+from the pool instead of sharing one webdriver or starting a new browser.
+
+
+Example
+        #-------[ parser.py ]---------------------------------------------------
+            from webparser.amazon import SeleniumAmazonBook
+            from webparser.pool import WebDriverPool
+
+            SeleniumAmazonBook.webdriver_pool = WebDriverPool(size=2)
+            SeleniumAmazonBook.webdriver_pool.warm()  # Start webdrivers
+
+            amazon_book = SeleniumAmazonBook('http://...')  # Acquire & parse
+            print(amazon_book.data['title'])
+            amazon_book.close()  # Release webdriver to the pool
+        #-----------------------------------------------------------------------
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from webparser.crawler import Crawler, _log_and_swallow
+
+
+__version__ = r'1.00'
+__author__ = r'Mikhail Ananyevskiy (aka soomrack) <soomrack@gmail.com>'
+
+
+class WebDriverPool(object):
+    """Pool of selenium webdrivers.
+
+    Object attributes:
+        size: integer.
+            Maximum number of webdrivers (browsers) in the pool.
+
+        factory: function.
+            Initializes new webdriver, returns webdriver object or None.
+            If it is None, then the factory given to acquire() or warm()
+            is used (Crawler passes webdriver_default of its class).
+
+        ttl: number.
+            Webdriver older than ttl seconds is quitted and replaced
+            with a new one.
+    """
+
+    def __init__(self, size=2, factory=None, ttl=300):
+        """Inits empty pool, webdrivers are started by warm() or acquire().
+
+        Args:
+            size: integer.
+                Maximum number of webdrivers, keep it small (2-4),
+                each browser takes a lot of memory.
+                Default value is 2.
+
+            factory: function.
+                Default value is None.
+
+            ttl: number.
+                Lifetime of webdriver, seconds.
+                Default value is 300.
+        """
+        self.size = size
+        self.factory = factory
+        self.ttl = ttl
+        self._idle = queue.Queue()  # Idle webdrivers, None is a free place
+        self._lock = threading.Lock()
+        self._started = {}  # Live webdriver (idle or acquired) -> start time
+        self._starting = 0  # Number of webdrivers which are being started
+        atexit.register(self.close)
+
+    def warm(self, factory=None):
+        """Starts webdrivers up to the pool size in background thread.
+
+        Args:
+            factory: function.
+                It is used if the pool has no own factory.
+                Default value is None (Crawler.webdriver_default).
+
+        Returns:
+            Thread object.
+        """
+        def start_all():
+            while True:
+                webdriver = self._new_webdriver(factory)
+                if webdriver is None:
+                    return
+                self._idle.put(webdriver)
+
+        thread = threading.Thread(target=start_all, daemon=True)
+        thread.start()
+        return thread
+
+    def acquire(self, timeout=30, factory=None):
+        """Takes webdriver from the pool.
+
+        Idle webdriver is taken if exists, else new webdriver is started
+        if the pool is not full, else waits for released webdriver
+        or for a free place (quitted webdriver) to start a new one.
+        If new webdriver fails to start, then returns None at once.
+
+        Args:
+            timeout: number.
+                Maximum waiting time, seconds.
+                Default value is 30.
+
+            factory: function.
+                It is used if the pool has no own factory.
+                Default value is None (Crawler.webdriver_default).
+
+        Returns:
+            Selenium webdriver object or None if failed.
+        """
+        deadline = time.monotonic() + timeout
+        webdriver = None
+        while webdriver is None:
+            try:
+                webdriver = self._idle.get_nowait()
+            except queue.Empty:
+                webdriver = self._new_webdriver(factory)
+                if webdriver is not None or not self._is_full():
+                    break  # New webdriver is started or failed to start
+                try:
+                    webdriver = self._idle.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    break
+            if webdriver is not None and self._is_expired(webdriver):
+                self._quit(webdriver)
+                webdriver = None
+        if webdriver is None:
+            logging.warning('[FAIL] acquire webdriver.')
+        else:
+            logging.info('[OK] acquire webdriver.')
+        return webdriver
+
+    def release(self, webdriver):
+        """Resets webdriver and puts it back to the pool.
+
+        Webdriver is reset as Crawler.reset_page() does (deletes cookies,
+        opens blank page). Expired or broken webdriver is quitted.
+
+        Args:
+            webdriver: selenium webdriver object.
+        """
+        if webdriver is None:
+            return
+        if self._is_expired(webdriver):
+            self._quit(webdriver)
+            return
+        if self._reset(webdriver):
+            self._idle.put(webdriver)
+        else:
+            self._quit(webdriver)
+
+    def close(self):
+        """Quits all webdrivers of the pool, idle and acquired ones.
+
+        It is called on interpreter exit, so no browsers are left running.
+        """
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        with self._lock:
+            webdrivers = list(self._started)
+        for webdriver in webdrivers:
+            self._quit(webdriver)
+
+    def _is_full(self):
+        """Returns True if no more webdrivers can be started."""
+        with self._lock:
+            return len(self._started) + self._starting >= self.size
+
+    def _new_webdriver(self, factory=None):
+        """Starts new webdriver, returns None if the pool is full or failed."""
+        with self._lock:
+            if len(self._started) + self._starting >= self.size:
+                return None
+            self._starting += 1
+        factory = self.factory or factory or Crawler.webdriver_default
+        webdriver = None
+        try:
+            webdriver = factory()
+        finally:
+            with self._lock:
+                self._starting -= 1
+                if webdriver is not None:
+                    self._started[webdriver] = time.monotonic()
+        return webdriver
+
+    @staticmethod
+    @_log_and_swallow('release webdriver.')
+    def _reset(webdriver):
+        """Deletes cookies and opens blank page, returns True is success."""
+        webdriver.delete_all_cookies()
+        webdriver.get('about:blank')
+        return True
+
+    def _is_expired(self, webdriver):
+        """Returns True if webdriver is older than ttl."""
+        started = self._started.get(webdriver)
+        return started is not None and time.monotonic() - started > self.ttl
+
+    def _quit(self, webdriver):
+        """Quits webdriver and removes it from the pool.
+
+        None is put to idle queue, it wakes up acquire() which waits,
+        so it starts a new webdriver in the free place.
+        """
+        with self._lock:
+            self._started.pop(webdriver, None)
+        Crawler._quit_webdriver(webdriver)
+        self._idle.put(None)
+
+
+def main():
+    """Print documentation and exit."""
+    print(__doc__)
+
+
+if __name__ == r'__main__':
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""tiny framework for parsing static web.
+
+This module provides base class for webparser of static webpages, it can
+    1. download webpages with requests (no browser, no javascript);
+    2. run a sequence of parsers over lxml tree of webpage;
+    3. handle requests exceptions;
+    4. log success and log fail.
+
+Static webpages are the pages which data is rendered by server
+in the initial html, so there is no need to run a browser.
+For webpages rendered with javascript use webparser.crawler.Crawler.
+
+
+Example
+        Create module contains parsers:
+        #-------[ amazon.py ]---------------------------------------------------
+            from webparser.static_crawler import StaticCrawler
+
+            class AmazonBook(StaticCrawler):
+                def __init__(self, url=None):
+                    self.parsers = (self.parse_title,)
+                    super().__init__(url)
+
+                def parse_title(self):
+                    title = self.webpage['tree'].xpath(
+                        "//span[@id='productTitle'][1]"
+                    )[0].text_content()
+                    self.data['title'] = title
+                    if title:
+                        return None
+                    return 'Title not found.'
+        #-----------------------------------------------------------------------
+
+
+Guideline [session]
+    1. All objects of current class (and of child classes) share one
+        requests session, so connections to website are kept alive.
+
+    2. Change headers (user agent, etc.) for new requests
+        StaticCrawler.headers = {'User-Agent': '...'}
+
+
+See webparser.crawler module docs for guidelines on child classes and logging.
+"""
+
+import requests
+
+from webparser.crawler import Crawler, _log_and_swallow, _url_message_args
+
+
+__version__ = r'1.00'
+__author__ = r'Mikhail Ananyevskiy (aka soomrack) <soomrack@gmail.com>'
+
+
+class StaticCrawler(Crawler):
+    """Base class for web webparser of static webpages.
+
+    Any webcrawler of static webpages should be a child class
+    of current class with realized routines for data retrieval (parsers).
+    Parsers should retrieve data from self.webpage['tree'],
+    there is no webdriver (see description of Crawler.parse() method).
+
+    Class attributes:
+        session: requests.Session object.
+            It is used by all objects of current class or of child classes
+            to download webpages (keep-alive connections are reused).
+
+        headers: dictionary.
+            HTTP headers of requests.
+
+        timeout: number.
+            Timeout of requests, seconds.
+    """
+
+    __slots__ = ()
+
+    session = None
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) '
+                      'AppleWebKit/537.36 (KHTML, like Gecko) '
+                      'Chrome/61.0.3163.100 Safari/537.36'
+    }
+    timeout = 30
+
+    @classmethod
+    def init_webdriver(cls):
+        """Inits requests session (class attribute) instead of webdriver.
+
+        """
+        if cls.session is None:
+            with cls._webdriver_lock:
+                if cls.session is None:
+                    cls.session = requests.Session()
+
+    @classmethod
+    def _drop_process_resources(cls):
+        """Drops session inherited from the parent process (in worker).
+
+        Forked worker must not share keep-alive connections of the parent.
+        """
+        super()._drop_process_resources()
+        cls.session = None
+
+    @_log_and_swallow('get webpage %s', message_args=_url_message_args,
+                      errors=(requests.exceptions.RequestException,))
+    def get(self, url):
+        """Try to download webpage.
+
+        Erases self.data and self.webpage, then sets self.webpage['url']
+        to url and self.webpage['page_source'] to the source of webpage,
+        it is parsed into lxml tree by parse().
+
+        Args:
+            url: string.
+
+        Returns:
+            True if download success, False otherwise.
+        """
+        self.data = {}
+        self.webpage = {'url': url}
+        response = self.session.get(url, headers=self.headers,
+                                    timeout=self.timeout)
+        response.raise_for_status()
+        self.webpage['page_source'] = response.content
+        return True
+
+    @_log_and_swallow('reset webpage.')
+    def reset_page(self):
+        """Reset session for the next webpage (deletes all cookies).
+
+        Returns:
+            True.
+        """
+        self.session.cookies.clear()
+        return True
+
+    def close(self):
+        """Close webpage, nothing to close for static webpage.
+
+        Returns:
+            True.
+        """
+        return True
+
+
+def main():
+    """Print documentation and exit."""
+    print(__doc__)
+
+
+if __name__ == r'__main__':
+    main()
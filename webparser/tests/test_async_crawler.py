@@ -0,0 +1,129 @@
+#!/usr/bin/python
+"""unittest for AsyncCrawler (with fake playwright context, no browser)
+
+"""
+
+import asyncio
+import unittest
+
+try:
+    import playwright.async_api
+    from webparser.async_crawler import AsyncCrawler
+except ImportError:
+    playwright = None
+    AsyncCrawler = object
+
+__version__ = r'1.00'
+__author__ = r'Mikhail Ananyevskiy (aka soomrack)'
+
+
+class FakePage(object):
+    content_html = '<html><body><span id="title">Title</span></body></html>'
+
+    def __init__(self, goto_error=False, content_html=None):
+        self.goto_error = goto_error
+        if content_html is not None:
+            self.content_html = content_html
+        self.is_closed = False
+
+    async def goto(self, url, wait_until=None):
+        if self.goto_error:
+            raise playwright.async_api.Error('goto')
+
+    async def content(self):
+        return self.content_html
+
+    async def inner_text(self, selector):
+        return 'Text'
+
+    async def close(self):
+        self.is_closed = True
+
+
+class FakeContext(object):
+    def __init__(self, new_page_error=False, goto_error=False,
+                 content_html=None):
+        self.new_page_error = new_page_error
+        self.goto_error = goto_error
+        self.content_html = content_html
+        self.pages = []
+
+    async def new_page(self):
+        if self.new_page_error:
+            raise playwright.async_api.Error('new_page')
+        page = FakePage(self.goto_error, self.content_html)
+        self.pages.append(page)
+        return page
+
+
+class FakeAsyncCrawler(AsyncCrawler):
+    def __init__(self, context=None, title_error=False):
+        self.title_error = title_error
+        self.parsers = (self.parse_title, self.parse_text)
+        super().__init__(context)
+
+    def parse_title(self):
+        """Parses title."""
+        if self.title_error:
+            return 'Title not found.'
+        self.data['title'] = self.webpage['tree'].xpath('//span/text()')[0]
+        return None
+
+    async def parse_text(self):
+        """Parses text."""
+        self.data['text'] = await self.webpage['page'].inner_text('#title')
+        return None
+
+
+@unittest.skipIf(playwright is None, 'playwright is not installed')
+class TestGetParseClose(unittest.TestCase):
+
+    def get_parse_close(self, context, **kwargs):
+        crawler = FakeAsyncCrawler(context, **kwargs)
+        result = asyncio.run(crawler.get_parse_close('http://example/'))
+        return crawler, result
+
+    def test_success(self):
+        context = FakeContext()
+        with self.assertLogs(level='INFO') as logs:
+            crawler, result = self.get_parse_close(context)
+        self.assertIs(result, True)
+        self.assertEqual(crawler.data, {'title': 'Title', 'text': 'Text'})
+        self.assertTrue(context.pages[0].is_closed)
+        self.assertIn('INFO:root:[OK] Parses title.', logs.output)
+        self.assertNotIn('tree', crawler.webpage)
+
+    def test_parse_error(self):
+        context = FakeContext()
+        with self.assertLogs(level='INFO') as logs:
+            crawler, result = self.get_parse_close(context, title_error=True)
+        self.assertIs(result, False)
+        self.assertIn('WARNING:root:[FAIL] Parses title.', logs.output)
+        self.assertTrue(context.pages[0].is_closed)
+
+    def test_xhtml_page_source(self):
+        context = FakeContext(content_html=(
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            '<html><body><span id="title">Caf\u00e9</span></body></html>'
+        ))
+        crawler, result = self.get_parse_close(context)
+        self.assertIs(result, True)
+        self.assertEqual(crawler.data['title'], 'Caf\u00e9')
+        self.assertTrue(context.pages[0].is_closed)
+
+    def test_goto_error_closes_page(self):
+        context = FakeContext(goto_error=True)
+        crawler, result = self.get_parse_close(context)
+        self.assertIs(result, False)
+        self.assertTrue(context.pages[0].is_closed)
+
+    def test_new_page_error_is_not_closed(self):
+        with self.assertLogs(level='INFO') as logs:
+            crawler, result = self.get_parse_close(
+                FakeContext(new_page_error=True))
+        self.assertIs(result, False)
+        self.assertNotIn('WARNING:root:[FAIL] close webpage.', logs.output)
+
+
+if __name__ == '__main__':
+    unittest.main()
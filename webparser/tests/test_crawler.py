@@ -0,0 +1,194 @@
+#!/usr/bin/python
+"""unittest for Crawler (with fake webdriver, no browser)
+
+"""
+
+import threading
+import unittest
+
+import selenium.common.exceptions
+
+from webparser.crawler import Crawler
+
+__version__ = r'1.00'
+__author__ = r'Mikhail Ananyevskiy (aka soomrack)'
+
+
+class FakeWebdriver(object):
+    page_source = '<html><body><span id="title">Title</span></body></html>'
+
+    def __init__(self, get_error=False, reset_error=False):
+        self.get_error = get_error
+        self.reset_error = reset_error
+        self.urls = []
+
+    def get(self, url):
+        if self.get_error and url != 'about:blank':
+            raise selenium.common.exceptions.WebDriverException('get')
+        if url != 'about:blank':
+            self.urls.append(url)
+
+    def delete_all_cookies(self):
+        if self.reset_error:
+            raise selenium.common.exceptions.WebDriverException('reset')
+
+
+class FakeCrawler(Crawler):
+    webdriver = FakeWebdriver()
+    result_cache_size = 0
+
+    def __init__(self, url=None, title_error=False):
+        self.title_error = title_error
+        self.parsers = (self.parse_title, self.parse_body)
+        super().__init__(url)
+
+    def parse_title(self):
+        """Parses title.
+
+        """
+        if self.title_error:
+            return 'Title not found.'
+        self.data['title'] = self.webpage['tree'].xpath('//span/text()')[0]
+        return None
+
+    def parse_body(self):
+        """Parses body.
+
+        """
+        self.data['body'] = True
+        self.data['body_thread'] = threading.get_ident()
+        return None
+
+
+class ParallelFakeCrawler(FakeCrawler):
+    parallel_parsers = True
+
+
+class TestGetParseClose(unittest.TestCase):
+    url = 'http://example.com/'
+
+    def test_success(self):
+        crawler = FakeCrawler()
+        self.assertIs(crawler.get_parse_close(self.url), True)
+        self.assertEqual(crawler.data['title'], 'Title')
+        self.assertIs(crawler.data['body'], True)
+        self.assertNotIn('tree', crawler.webpage)
+
+    def test_parse_error(self):
+        crawler = FakeCrawler(title_error=True)
+        self.assertIs(crawler.get_parse_close(self.url), False)
+
+    def test_reset_error(self):
+        crawler = FakeCrawler()
+        crawler.webdriver = FakeWebdriver(reset_error=True)
+        self.assertIs(crawler.get_parse_close(self.url), False)
+
+    def test_xhtml_page_source(self):
+        crawler = FakeCrawler()
+        crawler.webdriver = FakeWebdriver()
+        crawler.webdriver.page_source = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            '<html><body><span id="title">Caf\u00e9</span></body></html>'
+        )
+        self.assertIs(crawler.get_parse_close(self.url), True)
+        self.assertEqual(crawler.data['title'], 'Caf\u00e9')
+
+    def test_get_error(self):
+        crawler = FakeCrawler()
+        crawler.webdriver = FakeWebdriver(get_error=True)
+        self.assertIs(crawler.get_parse_close(self.url), False)
+
+
+class TestParse(unittest.TestCase):
+    url = 'http://example.com/'
+
+    def test_serial_by_default(self):
+        crawler = FakeCrawler()
+        crawler.get_parse_close(self.url)
+        self.assertEqual(crawler.data['body_thread'], threading.get_ident())
+
+    def test_parallel_parsers(self):
+        crawler = ParallelFakeCrawler()
+        crawler.get_parse_close(self.url)
+        self.assertNotEqual(crawler.data['body_thread'],
+                            threading.get_ident())
+
+
+class CachedFakeCrawler(FakeCrawler):
+    result_cache_size = 2
+
+
+class SmallCachedFakeCrawler(FakeCrawler):
+    result_cache_size = 1
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        Crawler._result_caches.clear()
+        self.crawler = CachedFakeCrawler()
+        self.crawler.webdriver = FakeWebdriver()
+
+    def test_hit(self):
+        self.crawler.get_parse_close('http://a/')
+        self.crawler.data['title'] = 'Changed'
+        self.assertIs(self.crawler.get_parse_close('http://a/'), True)
+        self.assertEqual(self.crawler.data['title'], 'Title')
+        self.assertEqual(self.crawler.webdriver.urls, ['http://a/'])
+
+    def test_refresh(self):
+        self.crawler.get_parse_close('http://a/')
+        self.assertIs(self.crawler.refresh('http://a/'), True)
+        self.assertEqual(self.crawler.webdriver.urls,
+                         ['http://a/', 'http://a/'])
+
+    def test_eviction(self):
+        for url in ('http://a/', 'http://b/', 'http://a/', 'http://c/'):
+            self.crawler.get_parse_close(url)
+        self.crawler.get_parse_close('http://a/')  # Recently used, cached
+        self.crawler.get_parse_close('http://b/')  # Least recently, evicted
+        self.assertEqual(self.crawler.webdriver.urls,
+                         ['http://a/', 'http://b/', 'http://c/', 'http://b/'])
+
+    def test_classes_have_own_caches(self):
+        self.crawler.get_parse_close('http://a/')
+        small_crawler = SmallCachedFakeCrawler()
+        small_crawler.webdriver = FakeWebdriver()
+        small_crawler.get_parse_close('http://b/')
+        small_crawler.get_parse_close('http://c/')
+        self.crawler.get_parse_close('http://a/')  # Cached, not evicted
+        self.assertEqual(self.crawler.webdriver.urls, ['http://a/'])
+        self.assertEqual(small_crawler.webdriver.urls,
+                         ['http://b/', 'http://c/'])
+
+
+class SlotsFakeCrawler(Crawler):
+    __slots__ = ()
+    webdriver = FakeWebdriver()
+
+    def __init__(self, url=None):
+        self.parsers = (self.parse_body,)
+        super().__init__(url)
+
+    def parse_body(self):
+        """Parses body.
+
+        """
+        return None
+
+
+class TestSlots(unittest.TestCase):
+
+    def test_parsers_are_not_in_dict(self):
+        crawler = SlotsFakeCrawler()
+        self.assertEqual(crawler.parsers, (crawler.parse_body,))
+        self.assertEqual(crawler.__dict__, {})
+
+    def test_default_parsers(self):
+        crawler = Crawler.__new__(SlotsFakeCrawler)
+        Crawler.__init__(crawler)
+        self.assertEqual(crawler.parsers, ())
+
+
+if __name__ == '__main__':
+    unittest.main()
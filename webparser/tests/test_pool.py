@@ -0,0 +1,91 @@
+#!/usr/bin/python
+"""unittest for WebDriverPool (with fake webdrivers, no browser)
+
+"""
+
+import threading
+import time
+import unittest
+
+from webparser.crawler import Crawler
+from webparser.pool import WebDriverPool
+
+__version__ = r'1.00'
+__author__ = r'Mikhail Ananyevskiy (aka soomrack)'
+
+
+class FakeWebdriver(object):
+    def __init__(self):
+        self.is_quitted = False
+
+    def get(self, url):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        self.is_quitted = True
+
+
+class TestWebDriverPool(unittest.TestCase):
+
+    def test_release_and_reuse(self):
+        pool = WebDriverPool(size=1, factory=FakeWebdriver)
+        webdriver = pool.acquire()
+        pool.release(webdriver)
+        self.assertIs(pool.acquire(), webdriver)
+
+    def test_full_pool_waits_timeout(self):
+        pool = WebDriverPool(size=1, factory=FakeWebdriver)
+        self.assertIsNotNone(pool.acquire())
+        self.assertIsNone(pool.acquire(timeout=0.01))
+
+    def test_failed_factory_fails_fast(self):
+        pool = WebDriverPool(size=1, factory=lambda: None)
+        started = time.monotonic()
+        self.assertIsNone(pool.acquire(timeout=10))
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_ttl_recycles_webdriver(self):
+        pool = WebDriverPool(size=1, factory=FakeWebdriver, ttl=-1)
+        webdriver = pool.acquire()
+        pool.release(webdriver)
+        self.assertTrue(webdriver.is_quitted)
+        self.assertIsNot(pool.acquire(), webdriver)
+
+    def test_waiter_starts_webdriver_when_expired_is_released(self):
+        pool = WebDriverPool(size=1, factory=FakeWebdriver, ttl=0.1)
+        webdriver = pool.acquire()
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(pool.acquire(timeout=5)))
+        started = time.monotonic()
+        waiter.start()
+        time.sleep(0.2)
+        pool.release(webdriver)  # Expired, quitted
+        waiter.join()
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertIsInstance(results[0], FakeWebdriver)
+        self.assertIsNot(results[0], webdriver)
+
+    def test_close_quits_acquired_webdrivers(self):
+        pool = WebDriverPool(size=2, factory=FakeWebdriver)
+        webdrivers = [pool.acquire(), pool.acquire()]
+        pool.close()
+        self.assertTrue(all(webdriver.is_quitted for webdriver in webdrivers))
+
+    def test_crawler_uses_webdriver_default_of_class(self):
+        class PoolCrawler(Crawler):
+            webdriver_pool = WebDriverPool(size=1)
+            webdriver_default = FakeWebdriver
+
+        crawler = PoolCrawler()
+        webdriver = crawler.webdriver
+        self.assertIsInstance(webdriver, FakeWebdriver)
+        crawler.close()
+        self.assertIs(PoolCrawler().webdriver, webdriver)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/python
+"""unittest for StaticCrawler and Crawler.crawl_many (with local http server)
+
+"""
+
+import http.server
+import threading
+import unittest
+
+from webparser.static_crawler import StaticCrawler
+
+__version__ = r'1.00'
+__author__ = r'Mikhail Ananyevskiy (aka soomrack)'
+
+
+class PageHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/missing':
+            self.send_error(404)
+            return
+        body = ('<html><body><span>Title %s</span></body></html>'
+                % self.path).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class KeepAlivePageHandler(PageHandler):
+    protocol_version = 'HTTP/1.1'  # Connections are reused by session
+
+
+class LocalStaticCrawler(StaticCrawler):
+    def __init__(self, url=None):
+        self.parsers = (self.parse_title,)
+        super().__init__(url)
+
+    def parse_title(self):
+        """Parses title."""
+        self.data['title'] = self.webpage['tree'].xpath('//span/text()')[0]
+        return None
+
+
+class TestCrawlMany(unittest.TestCase):
+    handler = PageHandler
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(
+            ('127.0.0.1', 0), cls.handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever,
+                                      daemon=True)
+        cls.thread.start()
+        cls.base_url = 'http://127.0.0.1:%d' % cls.server.server_port
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_get_parse_close(self):
+        crawler = LocalStaticCrawler(self.base_url + '/book')
+        self.assertEqual(crawler.data, {'title': 'Title /book'})
+
+    def test_crawl_many(self):
+        urls = [self.base_url + path for path in ('/a', '/missing', '/b')]
+        results = LocalStaticCrawler.crawl_many(urls, workers=2)
+        self.assertEqual(results, [
+            (urls[0], True, {'title': 'Title /a'}),
+            (urls[1], False, {}),
+            (urls[2], True, {'title': 'Title /b'}),
+        ])
+
+
+class TestCrawlManyKeepAlive(TestCrawlMany):
+    handler = KeepAlivePageHandler
+
+    def test_crawl_many_after_parent_session(self):
+        LocalStaticCrawler(self.base_url + '/parent')  # Warm parent session
+        urls = [self.base_url + '/%d' % index for index in range(40)]
+        results = LocalStaticCrawler.crawl_many(urls, workers=4)
+        self.assertEqual(results, [(url, True, {'title': 'Title /%d' % index})
+                                   for index, url in enumerate(urls)])
+
+
+if __name__ == '__main__':
+    unittest.main()